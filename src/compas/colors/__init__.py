@@ -19,6 +19,7 @@ Classes
     :nosignatures:
 
     Color
+    ColorArray
     ColorMap
 
 """
@@ -26,6 +27,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 from .color import Color
 from .colormap import ColorMap
 
@@ -33,3 +36,8 @@ __all__ = [
     'Color',
     'ColorMap'
 ]
+
+if not compas.IPY:
+    from .colorarray import ColorArray
+
+    __all__ += ['ColorArray']
@@ -20,6 +20,116 @@ try:
 except Exception:
     HEX_DEC = {v: int(v, 16) for v in [x + y for x in BASE16 for y in BASE16]}
 
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+
+# luma/luminance coefficients of the BT.601 and BT.709 standards.
+LUMA_BT601 = (0.299, 0.587, 0.114)
+LUMA_BT709 = (0.2126, 0.7152, 0.0722)
+
+
+def _rgb_to_hls(r, g, b):
+    """Convert RGB1 components to Hue, Lightness, Saturation.
+
+    Equivalent to ``colorsys.rgb_to_hls``,
+    but with a single branch on the max/min delta instead of repeated comparisons.
+    """
+    mx = r if r > g else g
+    mx = mx if mx > b else b
+    mn = r if r < g else g
+    mn = mn if mn < b else b
+    s_plus = mx + mn
+    d = mx - mn
+    l = 0.5 * s_plus  # noqa: E741
+    if d == 0.0:
+        return 0.0, l, 0.0
+    s = d / s_plus if l <= 0.5 else d / (2.0 - s_plus)
+    if mx == r:
+        h = (g - b) / d
+    elif mx == g:
+        h = (b - r) / d + 2.0
+    else:
+        h = (r - g) / d + 4.0
+    return (h / 6.0) % 1.0, l, s
+
+
+def _hls_value(m1, m2, hue):
+    hue = hue % 1.0
+    if hue < ONE_SIXTH:
+        return m1 + (m2 - m1) * hue * 6.0
+    if hue < 0.5:
+        return m2
+    if hue < TWO_THIRD:
+        return m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0
+    return m1
+
+
+def _hls_to_rgb(h, l, s):  # noqa: E741
+    """Convert Hue, Lightness, Saturation to RGB1 components.
+
+    Equivalent to ``colorsys.hls_to_rgb``.
+    """
+    if s == 0.0:
+        return l, l, l
+    m2 = l * (1.0 + s) if l <= 0.5 else l + s - l * s
+    m1 = 2.0 * l - m2
+    return _hls_value(m1, m2, h + ONE_THIRD), _hls_value(m1, m2, h), _hls_value(m1, m2, h - ONE_THIRD)
+
+
+def _rgb_to_hls_array(rgb):
+    """Vectorized equivalent of :func:`_rgb_to_hls` for an ``(..., 3)`` array of RGB1 colors."""
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    r = rgb[..., 0]
+    g = rgb[..., 1]
+    b = rgb[..., 2]
+    mx = rgb.max(axis=-1)
+    mn = rgb.min(axis=-1)
+    s_plus = mx + mn
+    d = mx - mn
+    l = 0.5 * s_plus  # noqa: E741
+    grey = d == 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, d / s_plus, d / (2.0 - s_plus))
+        h = np.select([mx == r, mx == g], [(g - b) / d, (b - r) / d + 2.0], default=(r - g) / d + 4.0)
+    h = np.where(grey, 0.0, (h / 6.0) % 1.0)
+    s = np.where(grey, 0.0, s)
+    return h, l, s
+
+
+def _hls_value_array(m1, m2, hue):
+    import numpy as np
+
+    hue = hue % 1.0
+    return np.select(
+        [hue < ONE_SIXTH, hue < 0.5, hue < TWO_THIRD],
+        [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0],
+        default=m1)
+
+
+def _hls_to_rgb_array(h, l, s):  # noqa: E741
+    """Vectorized equivalent of :func:`_hls_to_rgb`, returning an ``(..., 3)`` array of RGB1 colors."""
+    import numpy as np
+
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)
+    m1 = 2.0 * l - m2
+    return np.stack([
+        _hls_value_array(m1, m2, h + ONE_THIRD),
+        _hls_value_array(m1, m2, h),
+        _hls_value_array(m1, m2, h - ONE_THIRD),
+    ], axis=-1)
+
+
+# (slope, intercept) of each RGB channel on the four quarter segments of the spectrum,
+# with the spectrum parametrized by t = 4 * i, for i in the range 0-1.
+I_SEGMENTS = (
+    ((0.0, 0.0), (0.0, 0.0), (1.0, -2.0), (0.0, 1.0)),
+    ((1.0, 0.0), (0.0, 1.0), (0.0, 1.0), (-1.0, 4.0)),
+    ((0.0, 1.0), (-1.0, 2.0), (0.0, 0.0), (0.0, 0.0)),
+)
+
 
 class Color(Data):
     """Class for working with colors.
@@ -96,6 +206,8 @@ class Color(Data):
 
     """
 
+    __slots__ = ['_r', '_g', '_b', '_a']
+
     def __init__(self, red, green, blue, alpha=1.0, **kwargs):
         super(Color, self).__init__(**kwargs)
         self._r = 1.0
@@ -179,21 +291,20 @@ class Color(Data):
 
     @property
     def rgb255(self):
-        r = int(self.r * 255)
-        g = int(self.g * 255)
-        b = int(self.b * 255)
+        # read the slots directly to skip the property descriptors on this hot path
+        r = int(self._r * 255 + 0.5)
+        g = int(self._g * 255 + 0.5)
+        b = int(self._b * 255 + 0.5)
         return r, g, b
 
     @property
     def rgba(self):
-        r, g, b = self.rgb
-        a = self.a
-        return r, g, b, a
+        return self.r, self.g, self.b, self.a
 
     @property
     def rgba255(self):
         r, g, b = self.rgb255
-        a = int(self.a * 255)
+        a = int(self._a * 255 + 0.5)
         return r, g, b, a
 
     @property
@@ -202,11 +313,11 @@ class Color(Data):
 
     @property
     def hls(self):
-        return colorsys.rgb_to_hls(* self.rgb)
+        return _rgb_to_hls(self.r, self.g, self.b)
 
     @property
     def hsv(self):
-        return colorsys.rgb_to_hsv(* self.rgb)
+        return colorsys.rgb_to_hsv(self.r, self.g, self.b)
 
     @property
     def lightness(self):
@@ -225,8 +336,12 @@ class Color(Data):
         """tuple[float, float, float] :
         Luma and chroma components, with chroma defined by the blue and red projections.
         """
-        y = self.luma
-        u, v = self.chroma
+        r = self.r
+        g = self.g
+        b = self.b
+        y = 0.299 * r + 0.587 * g + 0.114 * b
+        u = 0.492 * (b - y)
+        v = 0.877 * (r - y)
         return y, u, v
 
     @property
@@ -242,9 +357,12 @@ class Color(Data):
         The color of a yuv signal.
         "How different from a grey of the same lightness the color appears to be."
         """
-        y = self.luma
-        u = 0.492 * (self.b - y)
-        v = 0.877 * (self.r - y)
+        r = self.r
+        g = self.g
+        b = self.b
+        y = 0.299 * r + 0.587 * g + 0.114 * b
+        u = 0.492 * (b - y)
+        v = 0.877 * (r - y)
         return u, v
 
     @property
@@ -286,7 +404,15 @@ class Color(Data):
         return iter(self.rgb)
 
     def __eq__(self, other):
-        return all(a == b for a, b in zip(self, other))
+        try:
+            return self.r == other[0] and self.g == other[1] and self.b == other[2]
+        except (TypeError, KeyError, IndexError):
+            return NotImplemented
+
+    def __hash__(self):
+        # alpha is excluded to keep the hash consistent with equality,
+        # which only compares the RGB components.
+        return hash((self.r, self.g, self.b))
 
     # --------------------------------------------------------------------------
     # constructors
@@ -334,7 +460,7 @@ class Color(Data):
         https://en.wikipedia.org/wiki/HSL_and_HSV
 
         """
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
+        r, g, b = _hls_to_rgb(h, l, s)
         return cls(r, g, b)
 
     @classmethod
@@ -420,35 +546,57 @@ class Color(Data):
 
         Parameters
         ----------
-        i : float
+        i : float | list[float]
             Number in the range 0-1, representing the color.
+            If a sequence of numbers is provided instead,
+            the computation is delegated to :meth:`from_i_array`.
 
         Returns
         -------
-        :class:`compas.colors.Color`
+        :class:`compas.colors.Color` | ndarray
+            A color if `i` is a single number,
+            or an array of RGB1 color tuples if `i` is a sequence of numbers.
 
         """
-        if i == 0.0:
-            r, g, b = 0, 0, 255
-        elif 0.0 < i < 0.25:
-            r, g, b = 0, int(255 * (4 * i)), 255
-        elif i == 0.25:
-            r, g, b = 0, 255, 255
-        elif 0.25 < i < 0.5:
-            r, g, b = 0, 255, int(255 - 255 * 4 * (i - 0.25))
-        elif i == 0.5:
-            r, g, b = 0, 255, 0
-        elif 0.5 < i < 0.75:
-            r, g, b = int(0 + 255 * 4 * (i - 0.5)), 255, 0
-        elif i == 0.75:
-            r, g, b = 255, 255, 0
-        elif 0.75 < i < 1.0:
-            r, g, b,  = 255, int(255 - 255 * 4 * (i - 0.75)), 0
-        elif i == 1.0:
-            r, g, b = 255, 0, 0
-        else:
-            r, g, b = 0, 0, 0
-        return cls(r / 255.0, g / 255.0, b / 255.0)
+        if not isinstance(i, (int, float)):
+            return cls.from_i_array(i)
+        if i < 0.0 or i > 1.0:
+            return cls(0.0, 0.0, 0.0)
+        t = 4.0 * i
+        k = min(int(t), 3)
+        r = int(255 * (I_SEGMENTS[0][k][0] * t + I_SEGMENTS[0][k][1])) / 255.0
+        g = int(255 * (I_SEGMENTS[1][k][0] * t + I_SEGMENTS[1][k][1])) / 255.0
+        b = int(255 * (I_SEGMENTS[2][k][0] * t + I_SEGMENTS[2][k][1])) / 255.0
+        return cls(r, g, b)
+
+    @classmethod
+    def from_i_array(cls, i):
+        """Construct an array of RGB1 color tuples from an array of numbers in the range 0-1.
+
+        Parameters
+        ----------
+        i : list[float] | ndarray
+            Numbers in the range 0-1, representing the colors.
+
+        Returns
+        -------
+        ndarray
+            An array of RGB1 color tuples with shape ``(N, 3)``.
+
+        """
+        import numpy as np
+
+        i = np.asarray(i, dtype=np.float64)
+        t = np.clip(4.0 * i, 0.0, 4.0)
+        invalid = (i < 0.0) | (i > 1.0)
+        rgb = np.empty(i.shape + (3,), dtype=np.float64)
+        conditions = [t < 1.0, t < 2.0, t < 3.0]
+        for channel, segments in enumerate(I_SEGMENTS):
+            choices = [slope * t + intercept for slope, intercept in segments[:3]]
+            default = segments[3][0] * t + segments[3][1]
+            value = np.select(conditions, choices, default=default)
+            rgb[..., channel] = np.where(invalid, 0.0, np.floor(255 * value) / 255.0)
+        return rgb
 
     @classmethod
     def from_hex(cls, value):
@@ -495,6 +643,19 @@ class Color(Data):
     # --------------------------------------------------------------------------
     # presets
     # --------------------------------------------------------------------------
+    # The preset constructors return shared, cached instances.
+    # Use :meth:`copy` (or the "-ed" variants of the modifier methods)
+    # before modifying a preset in place.
+
+    _presets = {}
+
+    @classmethod
+    def _preset(cls, name, r, g, b):
+        key = (cls, name)
+        color = cls._presets.get(key)
+        if color is None:
+            color = cls._presets[key] = cls(r, g, b)
+        return color
 
     @classmethod
     def white(cls):
@@ -505,7 +666,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 1.0, 1.0)
+        return cls._preset('white', 1.0, 1.0, 1.0)
 
     @classmethod
     def black(cls):
@@ -516,7 +677,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 0.0, 0.0)
+        return cls._preset('black', 0.0, 0.0, 0.0)
 
     @classmethod
     def grey(cls):
@@ -527,7 +688,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.5, 0.5)
+        return cls._preset('grey', 0.5, 0.5, 0.5)
 
     @classmethod
     def red(cls):
@@ -538,7 +699,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 0.0, 0.0)
+        return cls._preset('red', 1.0, 0.0, 0.0)
 
     @classmethod
     def orange(cls):
@@ -549,7 +710,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 0.5, 0.0)
+        return cls._preset('orange', 1.0, 0.5, 0.0)
 
     @classmethod
     def yellow(cls):
@@ -560,7 +721,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 1.0, 0.0)
+        return cls._preset('yellow', 1.0, 1.0, 0.0)
 
     @classmethod
     def lime(cls):
@@ -571,7 +732,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 1.0, 0.0)
+        return cls._preset('lime', 0.5, 1.0, 0.0)
 
     @classmethod
     def green(cls):
@@ -582,7 +743,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 1.0, 0.0)
+        return cls._preset('green', 0.0, 1.0, 0.0)
 
     @classmethod
     def mint(cls):
@@ -593,7 +754,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 1.0, 0.5)
+        return cls._preset('mint', 0.0, 1.0, 0.5)
 
     @classmethod
     def cyan(cls):
@@ -604,7 +765,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 1.0, 1.0)
+        return cls._preset('cyan', 0.0, 1.0, 1.0)
 
     @classmethod
     def azure(cls):
@@ -615,7 +776,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 0.5, 1.0)
+        return cls._preset('azure', 0.0, 0.5, 1.0)
 
     @classmethod
     def blue(cls):
@@ -626,7 +787,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 0.0, 1.0)
+        return cls._preset('blue', 0.0, 0.0, 1.0)
 
     @classmethod
     def violet(cls):
@@ -637,7 +798,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.0, 1.0)
+        return cls._preset('violet', 0.5, 0.0, 1.0)
 
     @classmethod
     def magenta(cls):
@@ -648,7 +809,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 0.0, 1.0)
+        return cls._preset('magenta', 1.0, 0.0, 1.0)
 
     @classmethod
     def pink(cls):
@@ -659,7 +820,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(1.0, 0.0, 0.5)
+        return cls._preset('pink', 1.0, 0.0, 0.5)
 
     # --------------------------------------------------------------------------
     # other presets
@@ -674,7 +835,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.0, 0.0)
+        return cls._preset('maroon', 0.5, 0.0, 0.0)
 
     @classmethod
     def brown(cls):
@@ -685,7 +846,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.25, 0.0)
+        return cls._preset('brown', 0.5, 0.25, 0.0)
 
     @classmethod
     def olive(cls):
@@ -696,7 +857,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.5, 0.0)
+        return cls._preset('olive', 0.5, 0.5, 0.0)
 
     @classmethod
     def teal(cls):
@@ -707,7 +868,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 0.5, 0.5)
+        return cls._preset('teal', 0.0, 0.5, 0.5)
 
     @classmethod
     def navy(cls):
@@ -718,7 +879,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.0, 0.0, 0.5)
+        return cls._preset('navy', 0.0, 0.0, 0.5)
 
     @classmethod
     def purple(cls):
@@ -729,7 +890,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.5, 0.0, 0.5)
+        return cls._preset('purple', 0.5, 0.0, 0.5)
 
     @classmethod
     def silver(cls):
@@ -740,7 +901,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        return cls(0.75, 0.75, 0.75)
+        return cls._preset('silver', 0.75, 0.75, 0.75)
 
     # ochre
     # beige
@@ -754,6 +915,33 @@ class Color(Data):
     # methods
     # --------------------------------------------------------------------------
 
+    def copy(self, cls=None):
+        """Make an independent copy of the color.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.colors.Color`], optional
+            The type of color to return.
+            Defaults to the type of the current color.
+
+        Returns
+        -------
+        :class:`compas.colors.Color`
+            An independent copy of this color.
+
+        Notes
+        -----
+        This bypasses the serialization round-trip of :meth:`compas.data.Data.copy`;
+        a color is fully described by its four float components.
+
+        """
+        if not cls:
+            cls = type(self)
+        return cls(self._r, self._g, self._b, self._a)
+
+    def __copy__(self):
+        return self.copy()
+
     def is_rgb1(self):
         """Verify that the color is in the RGB 1 color space.
 
@@ -812,8 +1000,8 @@ class Color(Data):
 
         factor = 1.0 + factor / 100
 
-        h, l, s = self.hls
-        r, g, b = colorsys.hls_to_rgb(h, min(1.0, l * factor), s)
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, min(1.0, l * factor), s)
         self.r = r
         self.g = g
         self.b = b
@@ -836,9 +1024,14 @@ class Color(Data):
             If the percentage of lightness increase is not in the range 0-100.
 
         """
-        color = self.copy()
-        color.lighten(factor=factor)
-        return color
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of increased lightness should be in the range 0-100.')
+
+        factor = 1.0 + factor / 100
+
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, min(1.0, l * factor), s)
+        return self.__class__(r, g, b, self.a)
 
     def darken(self, factor=10):
         """Darken the color.
@@ -863,8 +1056,8 @@ class Color(Data):
 
         factor = 1.0 - factor / 100
 
-        h, l, s = self.hls
-        r, g, b = colorsys.hls_to_rgb(h, max(0.0, l * factor), s)
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, max(0.0, l * factor), s)
         self.r = r
         self.g = g
         self.b = b
@@ -887,9 +1080,14 @@ class Color(Data):
             If the percentage of lightness reduction is not in the range 0-100.
 
         """
-        color = self.copy()
-        color.darken(factor=factor)
-        return color
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of reduced lightness should be in the range 0-100.')
+
+        factor = 1.0 - factor / 100
+
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, max(0.0, l * factor), s)
+        return self.__class__(r, g, b, self.a)
 
     def invert(self):
         """Invert the current color wrt to the RGB color circle.
@@ -911,9 +1109,7 @@ class Color(Data):
         :class:`compas.colors.Color`
 
         """
-        color = self.copy()
-        color.invert()
-        return color
+        return self.__class__(1.0 - self.r, 1.0 - self.g, 1.0 - self.b, self.a)
 
     def saturate(self, factor=10):
         """Saturate the color by a given percentage.
@@ -938,8 +1134,8 @@ class Color(Data):
 
         factor = 1.0 + factor / 100
 
-        h, l, s = self.hls
-        r, g, b = colorsys.hls_to_rgb(h, l, min(1.0, s * factor))
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, l, min(1.0, s * factor))
         self.r = r
         self.g = g
         self.b = b
@@ -962,9 +1158,14 @@ class Color(Data):
             If the percentage of desaturation is not in the range 0-100.
 
         """
-        color = self.copy()
-        color.saturate(factor=factor)
-        return color
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of saturation should be in the range 0-100.')
+
+        factor = 1.0 + factor / 100
+
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, l, min(1.0, s * factor))
+        return self.__class__(r, g, b, self.a)
 
     def desaturate(self, factor=10):
         """Desaturate the color by a given percentage.
@@ -989,8 +1190,8 @@ class Color(Data):
 
         factor = 1.0 - factor / 100
 
-        h, l, s = self.hls
-        r, g, b = colorsys.hls_to_rgb(h, l, max(0.0, s * factor))
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, l, max(0.0, s * factor))
         self.r = r
         self.g = g
         self.b = b
@@ -1013,6 +1214,168 @@ class Color(Data):
             If the percentage of desaturation is not in the range 0-100.
 
         """
-        color = self.copy()
-        color.desaturate(factor=factor)
-        return color
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of desaturation should be in the range 0-100.')
+
+        factor = 1.0 - factor / 100
+
+        h, l, s = _rgb_to_hls(self.r, self.g, self.b)
+        r, g, b = _hls_to_rgb(h, l, max(0.0, s * factor))
+        return self.__class__(r, g, b, self.a)
+
+    @classmethod
+    def lighten_array(cls, rgb, factor=10):
+        """Lighten an array of RGB1 colors.
+
+        Parameters
+        ----------
+        rgb : ndarray
+            Array of RGB1 color tuples with shape ``(N, 3)``.
+        factor : float, optional
+            Percentage of lightness increase.
+
+        Returns
+        -------
+        ndarray
+            Array of lightened RGB1 color tuples with shape ``(N, 3)``.
+
+        Raises
+        ------
+        ValueError
+            If the percentage of lightness increase is not in the range 0-100.
+
+        """
+        import numpy as np
+
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of increased lightness should be in the range 0-100.')
+
+        factor = 1.0 + factor / 100
+
+        h, l, s = _rgb_to_hls_array(rgb)
+        return _hls_to_rgb_array(h, np.minimum(1.0, l * factor), s)
+
+    @classmethod
+    def darken_array(cls, rgb, factor=10):
+        """Darken an array of RGB1 colors.
+
+        Parameters
+        ----------
+        rgb : ndarray
+            Array of RGB1 color tuples with shape ``(N, 3)``.
+        factor : float, optional
+            Percentage of lightness reduction.
+
+        Returns
+        -------
+        ndarray
+            Array of darkened RGB1 color tuples with shape ``(N, 3)``.
+
+        Raises
+        ------
+        ValueError
+            If the percentage of lightness reduction is not in the range 0-100.
+
+        """
+        import numpy as np
+
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of reduced lightness should be in the range 0-100.')
+
+        factor = 1.0 - factor / 100
+
+        h, l, s = _rgb_to_hls_array(rgb)
+        return _hls_to_rgb_array(h, np.maximum(0.0, l * factor), s)
+
+    @classmethod
+    def desaturate_array(cls, rgb, factor=10):
+        """Desaturate an array of RGB1 colors.
+
+        Parameters
+        ----------
+        rgb : ndarray
+            Array of RGB1 color tuples with shape ``(N, 3)``.
+        factor : float, optional
+            Percentage of saturation reduction.
+
+        Returns
+        -------
+        ndarray
+            Array of desaturated RGB1 color tuples with shape ``(N, 3)``.
+
+        Raises
+        ------
+        ValueError
+            If the percentage of desaturation is not in the range 0-100.
+
+        """
+        import numpy as np
+
+        if factor > 100 or factor < 0:
+            raise ValueError('Percentage of desaturation should be in the range 0-100.')
+
+        factor = 1.0 - factor / 100
+
+        h, l, s = _rgb_to_hls_array(rgb)
+        return _hls_to_rgb_array(h, l, np.maximum(0.0, s * factor))
+
+    @classmethod
+    def luma_array(cls, rgb):
+        """Compute the luma of an array of RGB1 colors.
+
+        Parameters
+        ----------
+        rgb : ndarray
+            Array of RGB1 color tuples with shape ``(N, 3)``.
+
+        Returns
+        -------
+        ndarray
+            Array of luma values with shape ``(N,)``.
+
+        """
+        import numpy as np
+
+        return np.dot(np.asarray(rgb, dtype=np.float64), LUMA_BT601)
+
+    @classmethod
+    def is_light_array(cls, r, g, b):
+        """Determine for each color in three parallel component arrays whether it is light.
+
+        Parameters
+        ----------
+        r : ndarray
+            Array of red components in the range 0-1.
+        g : ndarray
+            Array of green components in the range 0-1.
+        b : ndarray
+            Array of blue components in the range 0-1.
+
+        Returns
+        -------
+        ndarray
+            Boolean array, with True for the light colors.
+
+        """
+        return LUMA_BT709[0] * r + LUMA_BT709[1] * g + LUMA_BT709[2] * b > 0.179
+
+    @staticmethod
+    def to_rgb255_array(colors):
+        """Convert a collection of colors to an array of RGB255 components.
+
+        Parameters
+        ----------
+        colors : list[:class:`compas.colors.Color`] | ndarray
+            A list of colors, or an array of RGB(A)1 color tuples.
+
+        Returns
+        -------
+        ndarray
+            Array of RGB(A)255 color tuples with dtype ``uint8``,
+            with the components rounded half-up as in :attr:`rgb255`.
+
+        """
+        import numpy as np
+
+        colors = np.asarray(colors, dtype=np.float64)
+        return (colors * 255 + 0.5).astype(np.uint8)
@@ -0,0 +1,211 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import ascontiguousarray
+from numpy import float32
+from numpy import ones_like
+from numpy import stack
+from numpy import subtract
+from numpy import uint8
+
+from compas.colors.color import Color
+
+
+class ColorArray(object):
+    """Container for working with many colors at once.
+
+    The components are stored as four contiguous float32 arrays
+    (a "structure of arrays" layout) instead of one :class:`Color` object per color,
+    which keeps mesh-scale colorizations compact and cache-friendly
+    and lets all transforms run as vectorized numpy operations.
+
+    Parameters
+    ----------
+    r : array_like
+        The red components in the range of 0-1.
+    g : array_like
+        The green components in the range of 0-1.
+    b : array_like
+        The blue components in the range of 0-1.
+    a : array_like, optional
+        The alpha components in the range of 0-1.
+        Defaults to fully opaque.
+
+    Attributes
+    ----------
+    r : ndarray
+        Contiguous float32 array of red components.
+    g : ndarray
+        Contiguous float32 array of green components.
+    b : ndarray
+        Contiguous float32 array of blue components.
+    a : ndarray
+        Contiguous float32 array of alpha components.
+    rgb : ndarray, read-only
+        RGB1 color tuples as an array with shape ``(N, 3)``.
+
+    Examples
+    --------
+    >>> colors = ColorArray([1.0, 0.0], [0.0, 0.0], [0.0, 1.0])
+    >>> len(colors)
+    2
+    >>> colors[1]
+    Color(0.0, 0.0, 1.0, 1.0)
+
+    """
+
+    __slots__ = ['r', 'g', 'b', 'a']
+
+    def __init__(self, r, g, b, a=None):
+        self.r = ascontiguousarray(r, dtype=float32)
+        self.g = ascontiguousarray(g, dtype=float32)
+        self.b = ascontiguousarray(b, dtype=float32)
+        self.a = ascontiguousarray(a, dtype=float32) if a is not None else ones_like(self.r)
+
+    def __len__(self):
+        return len(self.r)
+
+    def __getitem__(self, key):
+        return Color(float(self.r[key]), float(self.g[key]), float(self.b[key]), float(self.a[key]))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def rgb(self):
+        return stack([self.r, self.g, self.b], axis=-1)
+
+    # --------------------------------------------------------------------------
+    # constructors
+    # --------------------------------------------------------------------------
+
+    @classmethod
+    def from_colors(cls, colors):
+        """Construct a color array from a sequence of colors.
+
+        Parameters
+        ----------
+        colors : sequence[:class:`compas.colors.Color`]
+            The colors.
+
+        Returns
+        -------
+        :class:`compas.colors.ColorArray`
+
+        """
+        return cls(
+            [color[0] for color in colors],
+            [color[1] for color in colors],
+            [color[2] for color in colors],
+            [color.a for color in colors])
+
+    @classmethod
+    def from_rgb(cls, rgb):
+        """Construct a color array from an array of RGB1 color tuples.
+
+        Parameters
+        ----------
+        rgb : array_like
+            Array of RGB1 color tuples with shape ``(N, 3)``.
+
+        Returns
+        -------
+        :class:`compas.colors.ColorArray`
+
+        """
+        rgb = ascontiguousarray(rgb, dtype=float32)
+        return cls(rgb[:, 0], rgb[:, 1], rgb[:, 2])
+
+    # --------------------------------------------------------------------------
+    # methods
+    # --------------------------------------------------------------------------
+
+    def invert(self):
+        """Invert the colors wrt to the RGB color circle, in place.
+
+        Returns
+        -------
+        None
+
+        """
+        subtract(1.0, self.r, out=self.r)
+        subtract(1.0, self.g, out=self.g)
+        subtract(1.0, self.b, out=self.b)
+
+    def lighten(self, factor=10):
+        """Lighten the colors, in place.
+
+        Parameters
+        ----------
+        factor : float, optional
+            Percentage of lightness increase.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the percentage of lightness increase is not in the range 0-100.
+
+        """
+        self._update(Color.lighten_array(self.rgb, factor=factor))
+
+    def darken(self, factor=10):
+        """Darken the colors, in place.
+
+        Parameters
+        ----------
+        factor : float, optional
+            Percentage of lightness reduction.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the percentage of lightness reduction is not in the range 0-100.
+
+        """
+        self._update(Color.darken_array(self.rgb, factor=factor))
+
+    def desaturate(self, factor=10):
+        """Desaturate the colors, in place.
+
+        Parameters
+        ----------
+        factor : float, optional
+            Percentage of saturation reduction.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the percentage of desaturation is not in the range 0-100.
+
+        """
+        self._update(Color.desaturate_array(self.rgb, factor=factor))
+
+    def to_rgb255(self):
+        """Convert the colors to an array of RGB255 components.
+
+        Returns
+        -------
+        ndarray
+            Array of RGB255 color tuples with dtype ``uint8`` and shape ``(N, 3)``,
+            with the components rounded half-up as in :attr:`compas.colors.Color.rgb255`.
+
+        """
+        return (self.rgb * 255 + 0.5).astype(uint8)
+
+    def _update(self, rgb):
+        self.r = ascontiguousarray(rgb[:, 0], dtype=float32)
+        self.g = ascontiguousarray(rgb[:, 1], dtype=float32)
+        self.b = ascontiguousarray(rgb[:, 2], dtype=float32)
@@ -10,8 +10,6 @@ from numpy import amin
 
 from scipy.interpolate import griddata
 
-import matplotlib.pyplot as plt
-
 from compas.numerical import scalarfield_contours_numpy
 
 
@@ -87,6 +85,10 @@ def mesh_contours_numpy(mesh, levels=50, density=100):
 
     Z = griddata((x, y), z, (X, Y), method='cubic')
 
+    # matplotlib is only needed for the contouring itself,
+    # so the (expensive) import is deferred until a contour is actually computed.
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, aspect='equal')
     c = ax.contour(X, Y, Z, levels)
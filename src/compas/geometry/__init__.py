@@ -160,7 +160,9 @@ Point Sets
     bestfit_plane_numpy
     bestfit_sphere_numpy
     bounding_box
+    bounding_box_numpy
     bounding_box_xy
+    bounding_box_xy_numpy
     convex_hull
     convex_hull_numpy
     convex_hull_xy
@@ -294,8 +296,10 @@ Triangle meshes
     trimesh_gaussian_curvature
     trimesh_geodistance
     trimesh_harmonic
+    trimesh_harmonic_cached
     trimesh_isolines
     trimesh_lscm
+    trimesh_lscm_cached
     trimesh_mean_curvature
     trimesh_massmatrix
     trimesh_principal_curvature
@@ -819,6 +823,8 @@ from .bbox import (  # noqa: E402
 )
 if not compas.IPY:
     from .bbox import (
+        bounding_box_numpy,
+        bounding_box_xy_numpy,
         oriented_bounding_box_numpy,
         oriented_bounding_box_xy_numpy,
         oabb_numpy
@@ -878,7 +884,9 @@ from .trimesh import (  # noqa: E402
     trimesh_isolines,
     trimesh_massmatrix,
     trimesh_harmonic,
+    trimesh_harmonic_cached,
     trimesh_lscm,
+    trimesh_lscm_cached,
     trimesh_remesh,
     trimesh_remesh_constrained,
     trimesh_remesh_along_isoline,
@@ -1156,7 +1164,9 @@ __all__ = [
     'trimesh_isolines',
     'trimesh_massmatrix',
     'trimesh_harmonic',
+    'trimesh_harmonic_cached',
     'trimesh_lscm',
+    'trimesh_lscm_cached',
     'trimesh_remesh',
     'trimesh_remesh_constrained',
     'trimesh_remesh_along_isoline',
@@ -1206,6 +1216,8 @@ __all__ = [
 
 if not compas.IPY:
     __all__ += [
+        'bounding_box_numpy',
+        'bounding_box_xy_numpy',
         'oriented_bounding_box_numpy',
         'oriented_bounding_box_xy_numpy',
         'oabb_numpy',
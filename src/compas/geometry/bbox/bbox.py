@@ -2,8 +2,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from itertools import islice
-
 
 __all__ = [
     'bounding_box',
@@ -29,13 +27,29 @@ def bounding_box(points):
     >>>
 
     """
-    x, y, z = zip(*points)
-    min_x = min(x)
-    max_x = max(x)
-    min_y = min(y)
-    max_y = max(y)
-    min_z = min(z)
-    max_z = max(z)
+    points = iter(points)
+    try:
+        x, y, z = next(points)
+    except StopIteration:
+        # raise instead of leaking the StopIteration,
+        # which would silently terminate an enclosing generator loop.
+        raise ValueError('At least one point is required.')
+    min_x = max_x = x
+    min_y = max_y = y
+    min_z = max_z = z
+    for x, y, z in points:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+        if z < min_z:
+            min_z = z
+        elif z > max_z:
+            max_z = z
     return [[min_x, min_y, min_z],
             [max_x, min_y, min_z],
             [max_x, max_y, min_z],
@@ -68,11 +82,26 @@ def bounding_box_xy(points):
     >>>
 
     """
-    x, y = islice(zip(*points), 2)
-    min_x = min(x)
-    max_x = max(x)
-    min_y = min(y)
-    max_y = max(y)
+    points = iter(points)
+    try:
+        point = next(points)
+    except StopIteration:
+        # raise instead of leaking the StopIteration,
+        # which would silently terminate an enclosing generator loop.
+        raise ValueError('At least one point is required.')
+    min_x = max_x = point[0]
+    min_y = max_y = point[1]
+    for point in points:
+        x = point[0]
+        y = point[1]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
     return [[min_x, min_y, 0.0],
             [max_x, min_y, 0.0],
             [max_x, max_y, 0.0],
@@ -23,15 +23,113 @@ from compas.geometry import Frame
 from compas.geometry import Transformation
 from compas.numerical import pca_numpy
 
-from compas.geometry.bbox.bbox import bounding_box
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 __all__ = [
+    'bounding_box_numpy',
+    'bounding_box_xy_numpy',
     'oriented_bounding_box_numpy',
     'oriented_bounding_box_xy_numpy',
     'oabb_numpy'
 ]
 
+# corner order of an axis-aligned box,
+# with 0/1 selecting the min/max bound per axis.
+BBOX_CORNERS = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+
+
+def _bbox_kernel(points):
+    """Single-pass min/max reduction over an ``(N, 3)`` coordinate array.
+
+    The loop is a simple scan reduction without aliasing,
+    which numba compiles to vectorized min/max instructions.
+    """
+    min_x = max_x = points[0, 0]
+    min_y = max_y = points[0, 1]
+    min_z = max_z = points[0, 2]
+    for i in range(1, points.shape[0]):
+        x = points[i, 0]
+        y = points[i, 1]
+        z = points[i, 2]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+        if z < min_z:
+            min_z = z
+        elif z > max_z:
+            max_z = z
+    return min_x, min_y, min_z, max_x, max_y, max_z
+
+
+if njit is not None:
+    _bbox_kernel = njit(cache=True, fastmath=True)(_bbox_kernel)
+
+
+def bounding_box_numpy(points):
+    """Compute the axis-aligned minimum bounding box of a set of points.
+
+    Parameters
+    ----------
+    points : array_like[point]
+        XYZ coordinates of the points.
+
+    Returns
+    -------
+    list[[float, float, float]]
+        XYZ coordinates of 8 points defining a box.
+
+    Notes
+    -----
+    This is the vectorized equivalent of :func:`compas.geometry.bounding_box`,
+    replacing the coordinate unzipping and per-axis min/max loops
+    with numpy reductions over the coordinate array.
+
+    """
+    points = asarray(points, dtype=float)
+    if njit is not None:
+        min_x, min_y, min_z, max_x, max_y, max_z = _bbox_kernel(points)
+        bounds = (min_x, min_y, min_z), (max_x, max_y, max_z)
+    else:
+        bounds = amin(points, axis=0), amax(points, axis=0)
+    return [[bounds[i][0], bounds[j][1], bounds[k][2]] for i, j, k in BBOX_CORNERS]
+
+
+def bounding_box_xy_numpy(points):
+    """Compute the axis-aligned minimum bounding box of a set of points in the XY-plane.
+
+    Parameters
+    ----------
+    points : array_like[point]
+        XY(Z) coordinates of the points.
+
+    Returns
+    -------
+    list[[float, float, 0.0]]
+        XYZ coordinates of four points defining a rectangle in the XY plane.
+
+    Notes
+    -----
+    This is the vectorized equivalent of :func:`compas.geometry.bounding_box_xy`.
+    The Z components of the points are simply ignored, if provided.
+
+    """
+    points = asarray(points, dtype=float)[:, :2]
+    mn = amin(points, axis=0)
+    mx = amax(points, axis=0)
+    return [[mn[0], mn[1], 0.0],
+            [mx[0], mn[1], 0.0],
+            [mx[0], mx[1], 0.0],
+            [mn[0], mx[1], 0.0]]
+
 
 # make alternative implementation using PCA
 # compare results
@@ -267,6 +365,6 @@ def oabb_numpy(points):
     world = Frame.worldXY()
     X = Transformation.from_frame_to_frame(frame, world)
     points = transform_points_numpy(points, X)
-    bbox = bounding_box(points)
+    bbox = bounding_box_numpy(points)
     bbox = transform_points_numpy(bbox, X.inverse())
     return bbox
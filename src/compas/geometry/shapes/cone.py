@@ -17,6 +17,16 @@ from compas.geometry import Plane
 
 from ._shape import Shape
 
+# unit circle cos/sin tables, keyed by resolution and shared by all cones.
+_unit_circles = {}
+
+
+def _unit_circle(u):
+    if u not in _unit_circles:
+        a = 2 * pi / u
+        _unit_circles[u] = [(cos(i * a), sin(i * a)) for i in range(u)]
+    return _unit_circles[u]
+
 
 class Cone(Shape):
     """A cone is defined by a circle and a height.
@@ -247,12 +257,9 @@ class Cone(Shape):
             raise ValueError('The value for u should be u > 3.')
 
         vertices = [[0, 0, 0]]
-        a = 2 * pi / u
         radius = self.circle.radius
-        for i in range(u):
-            x = radius * cos(i * a)
-            y = radius * sin(i * a)
-            vertices.append([x, y, 0])
+        for cosa, sina in _unit_circle(u):
+            vertices.append([radius * cosa, radius * sina, 0])
         vertices.append([0, 0, self.height])
 
         frame = Frame.from_plane(self.circle.plane)
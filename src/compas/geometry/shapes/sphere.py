@@ -5,11 +5,63 @@ from __future__ import print_function
 from math import cos
 from math import pi
 from math import sin
+from math import sqrt
 
 from compas.geometry import Point
 
 from ._shape import Shape
 
+# unit icosphere tessellations, keyed by subdivision depth and shared by all spheres.
+_icospheres = {}
+
+
+def _unit_icosphere(subdivisions):
+    if subdivisions in _icospheres:
+        return _icospheres[subdivisions]
+    t = (1.0 + sqrt(5.0)) / 2.0
+    d = sqrt(1.0 + t * t)
+    a = 1.0 / d
+    b = t / d
+    vertices = [
+        [-a, +b, 0.0], [+a, +b, 0.0], [-a, -b, 0.0], [+a, -b, 0.0],
+        [0.0, -a, +b], [0.0, +a, +b], [0.0, -a, -b], [0.0, +a, -b],
+        [+b, 0.0, -a], [+b, 0.0, +a], [-b, 0.0, -a], [-b, 0.0, +a]]
+    faces = [
+        [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+        [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+        [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+        [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]]
+    for _ in range(subdivisions):
+        midpoints = {}
+        subfaces = []
+        for u, v, w in faces:
+            uv = _edge_midpoint(u, v, vertices, midpoints)
+            vw = _edge_midpoint(v, w, vertices, midpoints)
+            wu = _edge_midpoint(w, u, vertices, midpoints)
+            subfaces.append([u, uv, wu])
+            subfaces.append([v, vw, uv])
+            subfaces.append([w, wu, vw])
+            subfaces.append([uv, vw, wu])
+        faces = subfaces
+    _icospheres[subdivisions] = vertices, faces
+    return vertices, faces
+
+
+def _edge_midpoint(u, v, vertices, midpoints):
+    key = (u, v) if u < v else (v, u)
+    if key in midpoints:
+        return midpoints[key]
+    a = vertices[u]
+    b = vertices[v]
+    x = 0.5 * (a[0] + b[0])
+    y = 0.5 * (a[1] + b[1])
+    z = 0.5 * (a[2] + b[2])
+    d = sqrt(x * x + y * y + z * z)
+    vertices.append([x / d, y / d, z / d])
+    index = len(vertices) - 1
+    midpoints[key] = index
+    return index
+
 
 class Sphere(Shape):
     """A sphere is defined by a point and a radius.
@@ -213,16 +265,25 @@ class Sphere(Shape):
         phi = pi*2 / u
         hpi = pi * 0.5
 
+        radius = self.radius
+        x0 = self.point.x
+        y0 = self.point.y
+        z0 = self.point.z
+
+        # the trig terms only depend on the ring (i) or the segment (j),
+        # so they are tabulated once instead of recomputed per vertex.
+        cosphi = [cos(j * phi) for j in range(u)]
+        sinphi = [sin(j * phi) for j in range(u)]
+
         vertices = []
         for i in range(1, v):
+            rc = radius * cos(i * theta - hpi)
+            tz = radius * sin(i * theta - hpi) + z0
             for j in range(u):
-                tx = self.radius * cos(i * theta - hpi) * cos(j * phi) + self.point.x
-                ty = self.radius * cos(i * theta - hpi) * sin(j * phi) + self.point.y
-                tz = self.radius * sin(i * theta - hpi) + self.point.z
-                vertices.append([tx, ty, tz])
+                vertices.append([rc * cosphi[j] + x0, rc * sinphi[j] + y0, tz])
 
-        vertices.append([self.point.x, self.point.y, self.point.z + self.radius])
-        vertices.append([self.point.x, self.point.y, self.point.z - self.radius])
+        vertices.append([x0, y0, z0 + radius])
+        vertices.append([x0, y0, z0 - radius])
 
         faces = []
 
@@ -259,6 +320,43 @@ class Sphere(Shape):
 
         return vertices, faces
 
+    def to_vertices_and_faces_icosphere(self, subdivisions=1):
+        """Returns a list of vertices and faces of an icosphere tessellation.
+
+        In contrast to the UV tessellation of :meth:`to_vertices_and_faces`,
+        the triangles of an icosphere are nearly uniform in size,
+        which gives the same visual smoothness with far fewer faces
+        and without clustering at the poles.
+
+        Parameters
+        ----------
+        subdivisions : int, optional
+            Number of subdivisions of the faces of the base icosahedron.
+            Every subdivision quadruples the number of faces.
+
+        Returns
+        -------
+        list[list[float]]
+            A list of vertex locations.
+        list[list[int]]
+            And a list of triangular faces,
+            with each face defined as a list of indices into the list of vertices.
+
+        """
+        if subdivisions < 0:
+            raise ValueError('The number of subdivisions should be non-negative.')
+
+        base, faces = _unit_icosphere(subdivisions)
+
+        radius = self.radius
+        x0 = self.point.x
+        y0 = self.point.y
+        z0 = self.point.z
+
+        vertices = [[x * radius + x0, y * radius + y0, z * radius + z0] for x, y, z in base]
+        faces = [face[:] for face in faces]
+        return vertices, faces
+
     def transform(self, transformation):
         """Transform the sphere.
 
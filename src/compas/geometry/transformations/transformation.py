@@ -247,10 +247,7 @@ class Transformation(Data):
         >>> T = Transformation.from_list(numbers)
 
         """
-        matrix = identity_matrix(4)
-        for i in range(4):
-            for j in range(4):
-                matrix[i][j] = float(numbers[i * 4 + j])
+        matrix = [[float(numbers[i * 4 + j]) for j in range(4)] for i in range(4)]
         return cls(matrix)
 
     @classmethod
@@ -2,15 +2,50 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import hashlib
+
 from compas.plugins import pluggable
 
 
 __all__ = [
     'trimesh_harmonic',
-    'trimesh_lscm'
+    'trimesh_harmonic_cached',
+    'trimesh_lscm',
+    'trimesh_lscm_cached'
 ]
 
 
+# parametrisations are cached per mesh; the caches are cleared wholesale
+# when they reach this size to bound memory use in long sessions.
+_harmonic_cache = {}
+_lscm_cache = {}
+_CACHE_MAXSIZE = 32
+
+
+def _trimesh_cache_key(M):
+    """Compute a cache key from the vertex and face data of a mesh.
+
+    Hashing the mesh data is much cheaper than recomputing a parametrisation,
+    but callers that can identify the mesh themselves
+    should pass an explicit key to the cached functions instead.
+    """
+    vertices, faces = M
+    try:
+        from numpy import asarray
+        vbytes = asarray(vertices, dtype=float).tobytes()
+        fbytes = asarray(faces).tobytes()
+    except ImportError:
+        vbytes = repr(vertices).encode('utf-8')
+        fbytes = repr(faces).encode('utf-8')
+    try:
+        h = hashlib.blake2b(digest_size=16)
+    except AttributeError:
+        h = hashlib.md5()
+    h.update(vbytes)
+    h.update(fbytes)
+    return h.hexdigest()
+
+
 @pluggable(category='trimesh')
 def trimesh_harmonic(M):
     """Compute the harmonic parametrisation of a triangle mesh within a fixed circular boundary.
@@ -33,6 +68,40 @@ def trimesh_harmonic(M):
     raise NotImplementedError
 
 
+def trimesh_harmonic_cached(M, key=None):
+    """Cached variant of :func:`trimesh_harmonic`.
+
+    Parameters
+    ----------
+    M : tuple[sequence[[float, float, float] | :class:`compas.geometry.Point`], sequence[[int, int, int]]]
+        A mesh represented by a list of vertices and a list of faces.
+    key : hashable, optional
+        Cache key identifying the mesh.
+        If not provided, a key is derived from the mesh data.
+
+    Returns
+    -------
+    list[[int, int]]
+        The u, v parameters per vertex.
+
+    Notes
+    -----
+    Use this function when repeatedly parametrising the same mesh during an
+    interactive session, for example while adjusting visualisation settings.
+    The returned list is a copy of the cached result and can be modified freely.
+
+    """
+    if key is None:
+        key = _trimesh_cache_key(M)
+    try:
+        result = _harmonic_cache[key]
+    except KeyError:
+        if len(_harmonic_cache) >= _CACHE_MAXSIZE:
+            _harmonic_cache.clear()
+        result = _harmonic_cache[key] = trimesh_harmonic(M)
+    return [uv[:] for uv in result]
+
+
 @pluggable(category='trimesh')
 def trimesh_lscm(M):
     """Compute the least squares conformal map of a triangle mesh.
@@ -53,3 +122,37 @@ def trimesh_lscm(M):
 
     """
     raise NotImplementedError
+
+
+def trimesh_lscm_cached(M, key=None):
+    """Cached variant of :func:`trimesh_lscm`.
+
+    Parameters
+    ----------
+    M : tuple[sequence[[float, float, float] | :class:`compas.geometry.Point`], sequence[[int, int, int]]]
+        A mesh represented by a list of vertices and a list of faces.
+    key : hashable, optional
+        Cache key identifying the mesh.
+        If not provided, a key is derived from the mesh data.
+
+    Returns
+    -------
+    list[[int, int]]
+        The u, v parameters per vertex.
+
+    Notes
+    -----
+    Use this function when repeatedly parametrising the same mesh during an
+    interactive session, for example while adjusting visualisation settings.
+    The returned list is a copy of the cached result and can be modified freely.
+
+    """
+    if key is None:
+        key = _trimesh_cache_key(M)
+    try:
+        result = _lscm_cache[key]
+    except KeyError:
+        if len(_lscm_cache) >= _CACHE_MAXSIZE:
+            _lscm_cache.clear()
+        result = _lscm_cache[key] = trimesh_lscm(M)
+    return [uv[:] for uv in result]
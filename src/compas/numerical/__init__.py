@@ -103,59 +103,72 @@ Utilities
 """
 from __future__ import absolute_import
 
+import importlib
+
 import compas
 
-if not compas.IPY:
-    from .linalg import (
-        nullspace,
-        rank,
-        dof,
-        pivots,
-        nonpivots,
-        rref,
-        rref_sympy,
-        rref_matlab,
-        uvw_lengths,
-        normrow,
-        normalizerow,
-        rot90,
-        solve_with_known,
-        spsolve_with_known,
-        chofactor,
-        lufactorized
-    )
-    from .matrices import (
-        adjacency_matrix,
-        degree_matrix,
-        connectivity_matrix,
-        laplacian_matrix,
-        face_matrix,
-        mass_matrix,
-        stiffness_matrix,
-        equilibrium_matrix,
-    )
-    from .operators import (
-        grad,
-        div,
-        curl
-    )
-    from .utilities import (
-        float_formatter,
-        set_array_print_precision,
-        unset_array_print_precision
-    )
+# map of numpy/scipy-backed names to the submodules providing them.
+# these imports are deferred to first use (PEP 562)
+# to keep `import compas` fast for users that never touch the solvers.
+_LAZY_IMPORTS = {
+    'nullspace': '.linalg',
+    'rank': '.linalg',
+    'dof': '.linalg',
+    'pivots': '.linalg',
+    'nonpivots': '.linalg',
+    'rref': '.linalg',
+    'rref_sympy': '.linalg',
+    'rref_matlab': '.linalg',
+    'uvw_lengths': '.linalg',
+    'normrow': '.linalg',
+    'normalizerow': '.linalg',
+    'rot90': '.linalg',
+    'solve_with_known': '.linalg',
+    'spsolve_with_known': '.linalg',
+    'chofactor': '.linalg',
+    'lufactorized': '.linalg',
+    'adjacency_matrix': '.matrices',
+    'degree_matrix': '.matrices',
+    'connectivity_matrix': '.matrices',
+    'laplacian_matrix': '.matrices',
+    'face_matrix': '.matrices',
+    'mass_matrix': '.matrices',
+    'stiffness_matrix': '.matrices',
+    'equilibrium_matrix': '.matrices',
+    'grad': '.operators',
+    'div': '.operators',
+    'curl': '.operators',
+    'float_formatter': '.utilities',
+    'set_array_print_precision': '.utilities',
+    'unset_array_print_precision': '.utilities',
+    'descent_numpy': '.descent',
+    'topop_numpy': '.topop',
+    'pca_numpy': '.pca',
+    'fd_numpy': '.fd',
+    'dr_numpy': '.dr',
+    'dr': '.dr',
+    'ga': '.ga',
+    'moga': '.ga',
+    'devo_numpy': '.devo',
+    'scalarfield_contours_numpy': '.isolines',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if compas.IPY:
+    # module-level __getattr__ (PEP 562) is never consulted by IronPython,
+    # so the pure-Python solvers are imported eagerly there.
+    from .dr import dr  # noqa: E402
+    from .ga import ga, moga  # noqa: E402
 
-if not compas.IPY:
-    from .descent import descent_numpy
-    from .topop import topop_numpy
-    from .pca import pca_numpy
-    from .fd import fd_numpy
-    from .dr import dr_numpy
-    from .devo import devo_numpy
-    from .isolines import scalarfield_contours_numpy
-
-from .dr import dr  # noqa: E402
-from .ga import ga, moga  # noqa: E402
 
 __all__ = [
     'dr',
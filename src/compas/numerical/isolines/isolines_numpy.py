@@ -8,7 +8,6 @@ from numpy import linspace
 from numpy import amax
 from numpy import amin
 from scipy.interpolate import griddata
-import matplotlib.pyplot as plt
 
 
 __all__ = [
@@ -98,6 +97,10 @@ def scalarfield_contours_numpy(xy, s, levels=50, density=100):
                     linspace(amin(y), amax(y), 2 * density))
     S = griddata((x, y), s, (X, Y), method='cubic')
 
+    # matplotlib is only needed for the contouring itself,
+    # so the (expensive) import is deferred until a contour is actually computed.
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, aspect='equal')
 
@@ -11,6 +11,12 @@ import compas_blender
 from compas.artists import PrimitiveArtist
 from .artist import BlenderArtist
 
+# default axis colors, shared by all frame artists.
+COLOR_ORIGIN = (0, 0, 0)
+COLOR_XAXIS = (255, 0, 0)
+COLOR_YAXIS = (0, 255, 0)
+COLOR_ZAXIS = (0, 0, 255)
+
 
 class FrameArtist(BlenderArtist, PrimitiveArtist):
     """Artist for drawing frames in Blender.
@@ -54,10 +60,10 @@ class FrameArtist(BlenderArtist, PrimitiveArtist):
         super().__init__(primitive=frame, collection=collection or frame.name, **kwargs)
 
         self.scale = scale or 1.0
-        self.color_origin = (0, 0, 0)
-        self.color_xaxis = (255, 0, 0)
-        self.color_yaxis = (0, 255, 0)
-        self.color_zaxis = (0, 0, 255)
+        self.color_origin = COLOR_ORIGIN
+        self.color_xaxis = COLOR_XAXIS
+        self.color_yaxis = COLOR_YAXIS
+        self.color_zaxis = COLOR_ZAXIS
 
     def draw(self) -> List[bpy.types.Object]:
         """Draw the frame.
@@ -97,13 +103,15 @@ class FrameArtist(BlenderArtist, PrimitiveArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        origin = self.primitive.point
-        X = self.primitive.point + self.primitive.xaxis.scaled(self.scale)
-        Y = self.primitive.point + self.primitive.yaxis.scaled(self.scale)
-        Z = self.primitive.point + self.primitive.zaxis.scaled(self.scale)
+        primitive = self.primitive
+        scale = self.scale
+        origin = primitive.point
+        X = origin + primitive.xaxis.scaled(scale)
+        Y = origin + primitive.yaxis.scaled(scale)
+        Z = origin + primitive.zaxis.scaled(scale)
         lines = [
-            {'start': origin, 'end': X, 'color': self.color_xaxis, 'name': f"{self.primitive.name}.xaxis"},
-            {'start': origin, 'end': Y, 'color': self.color_yaxis, 'name': f"{self.primitive.name}.yaxis"},
-            {'start': origin, 'end': Z, 'color': self.color_zaxis, 'name': f"{self.primitive.name}.zaxis"},
+            {'start': origin, 'end': X, 'color': self.color_xaxis, 'name': f"{primitive.name}.xaxis"},
+            {'start': origin, 'end': Y, 'color': self.color_yaxis, 'name': f"{primitive.name}.yaxis"},
+            {'start': origin, 'end': Z, 'color': self.color_zaxis, 'name': f"{primitive.name}.zaxis"},
         ]
         return compas_blender.draw_lines(lines, self.collection)
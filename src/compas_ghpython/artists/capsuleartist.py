@@ -46,7 +46,6 @@ class CapsuleArtist(GHArtist, ShapeArtist):
         u = u or self.u
         v = v or self.v
         vertices, faces = self.shape.to_vertices_and_faces(u=u, v=v)
-        vertices = [list(vertex) for vertex in vertices]
         mesh = compas_ghpython.draw_mesh(vertices,
                                          faces,
                                          color=color)
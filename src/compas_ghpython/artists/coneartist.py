@@ -22,6 +22,8 @@ class ConeArtist(GHArtist, ShapeArtist):
 
     def __init__(self, cone, **kwargs):
         super(ConeArtist, self).__init__(shape=cone, **kwargs)
+        self._tess_key = None
+        self._tess_cache = None
 
     def draw(self, color=None, u=None):
         """Draw the cone associated with the artist.
@@ -41,8 +43,14 @@ class ConeArtist(GHArtist, ShapeArtist):
         """
         color = color or self.color
         u = u or self.u
-        vertices, faces = self.shape.to_vertices_and_faces(u=u)
-        vertices = [list(vertex) for vertex in vertices]
+        # the tessellation is fully determined by the resolution and the cone geometry,
+        # so it can be reused across redraws as long as those don't change.
+        plane = self.shape.circle.plane
+        key = (u, self.shape.circle.radius, self.shape.height, tuple(plane.point), tuple(plane.normal))
+        if key != self._tess_key:
+            self._tess_key = key
+            self._tess_cache = self.shape.to_vertices_and_faces(u=u)
+        vertices, faces = self._tess_cache
         mesh = compas_ghpython.draw_mesh(vertices,
                                          faces,
                                          color=color)
@@ -42,7 +42,6 @@ class CylinderArtist(GHArtist, ShapeArtist):
         color = color or self.color
         u = u or self.u
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
-        vertices = [list(vertex) for vertex in vertices]
         mesh = compas_ghpython.draw_mesh(vertices,
                                          faces,
                                          color=color)
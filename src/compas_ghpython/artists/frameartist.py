@@ -6,6 +6,12 @@ import compas_ghpython
 from compas.artists import PrimitiveArtist
 from .artist import GHArtist
 
+# default axis colors, shared by all frame artists.
+COLOR_ORIGIN = (0, 0, 0)
+COLOR_XAXIS = (255, 0, 0)
+COLOR_YAXIS = (0, 255, 0)
+COLOR_ZAXIS = (0, 0, 255)
+
 
 class FrameArtist(GHArtist, PrimitiveArtist):
     """Artist for drawing frames.
@@ -38,10 +44,10 @@ class FrameArtist(GHArtist, PrimitiveArtist):
     def __init__(self, frame, scale=1.0, **kwargs):
         super(FrameArtist, self).__init__(primitive=frame, **kwargs)
         self.scale = scale
-        self.color_origin = (0, 0, 0)
-        self.color_xaxis = (255, 0, 0)
-        self.color_yaxis = (0, 255, 0)
-        self.color_zaxis = (0, 0, 255)
+        self.color_origin = COLOR_ORIGIN
+        self.color_xaxis = COLOR_XAXIS
+        self.color_yaxis = COLOR_YAXIS
+        self.color_zaxis = COLOR_ZAXIS
 
     def draw(self):
         """Draw the frame.
@@ -77,10 +83,11 @@ class FrameArtist(GHArtist, PrimitiveArtist):
 
     @staticmethod
     def _get_args(primitive, scale=1.0, color_origin=(0, 0, 0), color_xaxis=(255, 0, 0), color_yaxis=(0, 255, 0), color_zaxis=(0, 0, 255)):
-        origin = list(primitive.point)
-        x = list(primitive.point + primitive.xaxis.scaled(scale))
-        y = list(primitive.point + primitive.yaxis.scaled(scale))
-        z = list(primitive.point + primitive.zaxis.scaled(scale))
+        point = primitive.point
+        origin = list(point)
+        x = list(point + primitive.xaxis.scaled(scale))
+        y = list(point + primitive.yaxis.scaled(scale))
+        z = list(point + primitive.zaxis.scaled(scale))
         point = {'pos': origin, 'color': color_origin}
         lines = [
             {'start': origin, 'end': x, 'color': color_xaxis, 'arrow': 'end'},
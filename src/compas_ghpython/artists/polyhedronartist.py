@@ -37,7 +37,7 @@ class PolyhedronArtist(GHArtist, ShapeArtist):
 
         """
         color = color or self.color
-        vertices = [list(vertex) for vertex in self.shape.vertices]
+        vertices = self.shape.vertices
         faces = self.shape.faces
         mesh = compas_ghpython.draw_mesh(vertices,
                                          faces,
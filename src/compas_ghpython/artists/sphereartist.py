@@ -18,10 +18,20 @@ class SphereArtist(GHArtist, ShapeArtist):
         Additional keyword arguments.
         See :class:`compas_ghpython.artists.GHArtist` and :class:`compas.artists.ShapeArtist` for more info.
 
+    Attributes
+    ----------
+    subdivisions : int
+        If set, the sphere is drawn as an icosphere with this number of subdivisions
+        instead of a UV tessellation.
+        Default is None.
+
     """
 
     def __init__(self, sphere, **kwargs):
         super(SphereArtist, self).__init__(shape=sphere, **kwargs)
+        self.subdivisions = None
+        self._tess_key = None
+        self._tess_cache = None
 
     def draw(self, color=None, u=None, v=None):
         """Draw the sphere associated with the artist.
@@ -45,8 +55,16 @@ class SphereArtist(GHArtist, ShapeArtist):
         color = color or self.color
         u = u or self.u
         v = v or self.v
-        vertices, faces = self.shape.to_vertices_and_faces(u=u, v=v)
-        vertices = [list(vertex) for vertex in vertices]
+        # the tessellation is fully determined by the resolution and the sphere geometry,
+        # so it can be reused across redraws as long as those don't change.
+        key = (u, v, self.subdivisions, self.shape.radius, tuple(self.shape.point))
+        if key != self._tess_key:
+            self._tess_key = key
+            if self.subdivisions is None:
+                self._tess_cache = self.shape.to_vertices_and_faces(u=u, v=v)
+            else:
+                self._tess_cache = self.shape.to_vertices_and_faces_icosphere(subdivisions=self.subdivisions)
+        vertices, faces = self._tess_cache
         mesh = compas_ghpython.draw_mesh(vertices,
                                          faces,
                                          color=color)
@@ -40,7 +40,7 @@ class BoxArtist(RhinoArtist, ShapeArtist):
 
         """
         color = color or self.color
-        vertices = [list(vertex) for vertex in self.shape.vertices]
+        vertices = self.shape.vertices
         faces = self.shape.faces
         guid = compas_rhino.draw_mesh(vertices,
                                       faces,
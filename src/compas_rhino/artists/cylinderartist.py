@@ -45,7 +45,6 @@ class CylinderArtist(RhinoArtist, ShapeArtist):
         color = color or self.color
         u = u or self.u
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
-        vertices = [list(vertex) for vertex in vertices]
         guid = compas_rhino.draw_mesh(vertices,
                                       faces,
                                       layer=self.layer,
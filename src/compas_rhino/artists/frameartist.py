@@ -6,6 +6,12 @@ import compas_rhino
 from compas.artists import PrimitiveArtist
 from .artist import RhinoArtist
 
+# default axis colors, shared by all frame artists.
+COLOR_ORIGIN = (0, 0, 0)
+COLOR_XAXIS = (255, 0, 0)
+COLOR_YAXIS = (0, 255, 0)
+COLOR_ZAXIS = (0, 0, 255)
+
 
 class FrameArtist(RhinoArtist, PrimitiveArtist):
     """Artist for drawing frames.
@@ -41,10 +47,10 @@ class FrameArtist(RhinoArtist, PrimitiveArtist):
     def __init__(self, frame, layer=None, scale=1.0, **kwargs):
         super(FrameArtist, self).__init__(primitive=frame, layer=layer, **kwargs)
         self.scale = scale or 1.0
-        self.color_origin = (0, 0, 0)
-        self.color_xaxis = (255, 0, 0)
-        self.color_yaxis = (0, 255, 0)
-        self.color_zaxis = (0, 0, 255)
+        self.color_origin = COLOR_ORIGIN
+        self.color_xaxis = COLOR_XAXIS
+        self.color_yaxis = COLOR_YAXIS
+        self.color_zaxis = COLOR_ZAXIS
 
     def draw(self):
         """Draw the frame.
@@ -55,12 +61,13 @@ class FrameArtist(RhinoArtist, PrimitiveArtist):
             The GUIDs of the created Rhino objects.
 
         """
-        points = []
-        lines = []
-        origin = list(self.primitive.point)
-        X = list(self.primitive.point + self.primitive.xaxis.scaled(self.scale))
-        Y = list(self.primitive.point + self.primitive.yaxis.scaled(self.scale))
-        Z = list(self.primitive.point + self.primitive.zaxis.scaled(self.scale))
+        primitive = self.primitive
+        scale = self.scale
+        point = primitive.point
+        origin = list(point)
+        X = list(point + primitive.xaxis.scaled(scale))
+        Y = list(point + primitive.yaxis.scaled(scale))
+        Z = list(point + primitive.zaxis.scaled(scale))
         points = [{'pos': origin, 'color': self.color_origin}]
         lines = [
             {'start': origin, 'end': X, 'color': self.color_xaxis, 'arrow': 'end'},
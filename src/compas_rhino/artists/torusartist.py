@@ -49,7 +49,6 @@ class TorusArtist(RhinoArtist, ShapeArtist):
         u = u or self.u
         v = v or self.v
         vertices, faces = self.shape.to_vertices_and_faces(u=u, v=v)
-        vertices = [list(vertex) for vertex in vertices]
         guid = compas_rhino.draw_mesh(vertices,
                                       faces,
                                       layer=self.layer,
@@ -5,6 +5,8 @@ from __future__ import division
 import Rhino
 import compas_rhino
 
+from ._transformations import xform_from_transformation_matrix
+
 
 class RhinoGeometry(object):
     """Base class for Rhino Geometry and DocObject wrappers.
@@ -172,10 +174,7 @@ class RhinoGeometry(object):
 
         """
         if not isinstance(T, Rhino.Geometry.Transform):
-            M = Rhino.Geometry.Transform(0.0)
-            for i in range(4):
-                for j in range(4):
-                    M[i, j] = T[i, j]
+            M = xform_from_transformation_matrix(T.matrix)
         else:
             M = T
         self.geometry.Transform(M)
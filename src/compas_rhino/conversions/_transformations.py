@@ -4,6 +4,12 @@ from __future__ import print_function
 
 from Rhino.Geometry import Transform
 
+# already converted transforms, keyed by the 16 matrix values.
+# broadcasting one transformation to many objects hits this cache
+# instead of repeating the per-cell managed-object fill.
+_xforms = {}
+_XFORMS_MAXSIZE = 256
+
 
 def xform_from_transformation(transformation):
     """Creates a Rhino transformation from a COMPAS transformation.
@@ -18,11 +24,7 @@ def xform_from_transformation(transformation):
     :rhino:`Rhino.Geometry.Transform`
 
     """
-    transform = Transform(1.0)
-    for i in range(0, 4):
-        for j in range(0, 4):
-            transform[i, j] = transformation[i, j]
-    return transform
+    return xform_from_transformation_matrix(transformation.matrix)
 
 
 xform_to_rhino = xform_from_transformation
@@ -41,11 +43,22 @@ def xform_from_transformation_matrix(matrix):
     :rhino:`Rhino.Geometry.Transform`
 
     """
-    transform = Transform(1.0)
-    for i in range(0, 4):
-        for j in range(0, 4):
-            transform[i, j] = matrix[i][j]
-    return transform
+    key = tuple(matrix[0]) + tuple(matrix[1]) + tuple(matrix[2]) + tuple(matrix[3])
+    transform = _xforms.get(key)
+    if transform is None:
+        transform = Transform(1.0)
+        for i in range(0, 4):
+            row = matrix[i]
+            transform[i, 0] = row[0]
+            transform[i, 1] = row[1]
+            transform[i, 2] = row[2]
+            transform[i, 3] = row[3]
+        if len(_xforms) >= _XFORMS_MAXSIZE:
+            _xforms.clear()
+        _xforms[key] = transform
+    # multiplying with the identity clones the transform natively,
+    # so callers can't mutate the cached instance through the returned one.
+    return Transform.Multiply(transform, Transform.Identity)
 
 
 xform_matrix_to_rhino = xform_from_transformation_matrix
@@ -9,6 +9,19 @@ from compas_rhino.artists import RhinoArtist
 _ITEM_OBJECT = {}
 
 
+def _is_translation(M):
+    """True if the 4x4 matrix is a pure translation, i.e. its linear part is the identity.
+
+    The view-transform matrices composed by the objects contain exact zeros and ones
+    in the linear part whenever no scale or rotation is applied,
+    so exact comparisons suffice here.
+    """
+    a, b, c = M[0], M[1], M[2]
+    return (a[0] == 1.0 and a[1] == 0.0 and a[2] == 0.0 and
+            b[0] == 0.0 and b[1] == 1.0 and b[2] == 0.0 and
+            c[0] == 0.0 and c[1] == 0.0 and c[2] == 1.0)
+
+
 class BaseObject(object):
     """Abstract base class for COMPAS Rhino objects.
 
@@ -49,6 +62,8 @@ class BaseObject(object):
 
     """
 
+    __slots__ = ['_item', '_id', '_scene', '_artist', 'visible', 'settings']
+
     def __init__(self, item, scene=None, name=None, layer=None, visible=True, settings=None):
         super(BaseObject, self).__init__()
         self._item = None
@@ -89,7 +104,7 @@ class BaseObject(object):
 
     @property
     def id(self):
-        if not self._id:
+        if self._id is None:
             self._id = uuid4()
         return self._id
 
@@ -120,7 +135,7 @@ class BaseObject(object):
 
     @staticmethod
     def registered_object_types():
-        return [_ITEM_OBJECT[item_type] for item_type in _ITEM_OBJECT]
+        return list(_ITEM_OBJECT.values())
 
     @staticmethod
     def build(item, **kwargs):
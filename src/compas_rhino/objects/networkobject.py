@@ -3,14 +3,15 @@ from __future__ import division
 from __future__ import print_function
 
 from functools import reduce
-from operator import mul
 
 import compas_rhino
 
 from compas.geometry import Point
-from compas.geometry import Scale
-from compas.geometry import Translation
-from compas.geometry import Rotation
+from compas.geometry import matrix_from_euler_angles
+from compas.geometry import matrix_from_scale_factors
+from compas.geometry import matrix_from_translation
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_points
 
 from ._modify import network_update_attributes
 from ._modify import network_update_node_attributes
@@ -18,6 +19,7 @@ from ._modify import network_update_edge_attributes
 from ._modify import network_move_node
 
 from ._object import BaseObject
+from ._object import _is_translation
 
 
 class NetworkObject(BaseObject):
@@ -136,27 +138,30 @@ class NetworkObject(BaseObject):
     def node_xyz(self):
         """dict : The view coordinates of the mesh object."""
         origin = Point(0, 0, 0)
+        # the stack holds raw 4x4 matrices to avoid Transformation wrappers per redraw.
         stack = []
         if self.scale != 1.0:
-            S = Scale.from_factors([self.scale] * 3)
-            stack.append(S)
+            stack.append(matrix_from_scale_factors([self.scale] * 3))
         if self.rotation != [0, 0, 0]:
-            R = Rotation.from_euler_angles(self.rotation)
-            stack.append(R)
+            stack.append(matrix_from_euler_angles(self.rotation))
         if self.location != origin:
             if self.anchor is not None:
                 xyz = self.network.vertex_attributes(self.anchor, 'xyz')
                 point = Point(* xyz)
-                T1 = Translation.from_vector(origin - point)
-                stack.insert(0, T1)
-            T2 = Translation.from_vector(self.location)
-            stack.append(T2)
+                stack.insert(0, matrix_from_translation(origin - point))
+            stack.append(matrix_from_translation(self.location))
+        nodes = list(self.network.nodes())
+        xyz = [self.network.node_attributes(node, 'xyz') for node in nodes]
         if stack:
-            X = reduce(mul, stack[::-1])
-            network = self.network.transformed(X)
-        else:
-            network = self.network
-        node_xyz = {network: network.node_attributes(node, 'xyz') for node in network.nodes()}
+            M = stack[0] if len(stack) == 1 else reduce(multiply_matrices, stack[::-1])
+            if _is_translation(M):
+                # moving objects around is the common case and doesn't need
+                # the full 4x4 transform per point.
+                tx, ty, tz = M[0][3], M[1][3], M[2][3]
+                xyz = [[x + tx, y + ty, z + tz] for x, y, z in xyz]
+            else:
+                xyz = transform_points(xyz, M)
+        node_xyz = dict(zip(nodes, xyz))
         return node_xyz
 
     @property
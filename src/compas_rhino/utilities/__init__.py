@@ -72,6 +72,7 @@ drawing
     draw_pipes
     draw_spheres
     draw_mesh
+    draw_meshes
     draw_curves
     draw_surfaces
 
@@ -187,6 +188,7 @@ from .drawing import (
     draw_pipes,
     draw_spheres,
     draw_mesh,
+    draw_meshes,
     draw_circles,
     draw_curves,
     draw_surfaces,
@@ -286,6 +288,7 @@ __all__ = [
     'draw_pipes',
     'draw_spheres',
     'draw_mesh',
+    'draw_meshes',
     'draw_circles',
     'draw_curves',
     'draw_surfaces',
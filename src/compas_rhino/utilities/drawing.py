@@ -80,6 +80,7 @@ __all__ = [
     'draw_pipes',
     'draw_spheres',
     'draw_mesh',
+    'draw_meshes',
     'draw_circles',
     'draw_surfaces',
 ]
@@ -775,53 +776,57 @@ def draw_mesh(vertices, faces, name=None, color=None, disjoint=False, **kwargs):
 
     """
     mesh = RhinoMesh()
+    # bind the vertex/face adders once instead of traversing
+    # the managed attribute chain for every vertex and face.
+    add_vertex = mesh.Vertices.Add
+    add_face = mesh.Faces.AddFace
     if disjoint:
         for face in faces:
             f = len(face)
             if f < 3:
                 continue
             if f == 3:
-                a = mesh.Vertices.Add(* vertices[face[0]])
-                b = mesh.Vertices.Add(* vertices[face[1]])
-                c = mesh.Vertices.Add(* vertices[face[2]])
-                mesh.Faces.AddFace(a, b, c)
+                a = add_vertex(* vertices[face[0]])
+                b = add_vertex(* vertices[face[1]])
+                c = add_vertex(* vertices[face[2]])
+                add_face(a, b, c)
             elif f == 4:
-                a = mesh.Vertices.Add(* vertices[face[0]])
-                b = mesh.Vertices.Add(* vertices[face[1]])
-                c = mesh.Vertices.Add(* vertices[face[2]])
-                d = mesh.Vertices.Add(* vertices[face[3]])
-                mesh.Faces.AddFace(a, b, c, d)
+                a = add_vertex(* vertices[face[0]])
+                b = add_vertex(* vertices[face[1]])
+                c = add_vertex(* vertices[face[2]])
+                d = add_vertex(* vertices[face[3]])
+                add_face(a, b, c, d)
             else:
                 if MeshNgon:
                     points = [vertices[vertex] for vertex in face]
                     centroid = centroid_polygon(points)
                     indices = []
                     for point in points:
-                        indices.append(mesh.Vertices.Add(* point))
-                    c = mesh.Vertices.Add(* centroid)
+                        indices.append(add_vertex(* point))
+                    c = add_vertex(* centroid)
                     facets = []
                     for i, j in pairwise(indices + indices[:1]):
-                        facets.append(mesh.Faces.AddFace(i, j, c))
+                        facets.append(add_face(i, j, c))
                     ngon = MeshNgon.Create(indices, facets)
                     mesh.Ngons.AddNgon(ngon)
     else:
         for x, y, z in vertices:
-            mesh.Vertices.Add(x, y, z)
+            add_vertex(x, y, z)
         for face in faces:
             f = len(face)
             if f < 3:
                 continue
             if f == 3:
-                mesh.Faces.AddFace(*face)
+                add_face(*face)
             elif f == 4:
-                mesh.Faces.AddFace(*face)
+                add_face(*face)
             else:
                 if MeshNgon:
                     centroid = centroid_polygon([vertices[index] for index in face])
-                    c = mesh.Vertices.Add(* centroid)
+                    c = add_vertex(* centroid)
                     facets = []
                     for i, j in pairwise(face + face[:1]):
-                        facets.append(mesh.Faces.AddFace(i, j, c))
+                        facets.append(add_face(i, j, c))
                     ngon = MeshNgon.Create(face, facets)
                     mesh.Ngons.AddNgon(ngon)
 
@@ -845,6 +850,37 @@ def draw_mesh(vertices, faces, name=None, color=None, disjoint=False, **kwargs):
         return guid
 
 
+def draw_meshes(items, name=None, color=None, disjoint=False, **kwargs):
+    """Draw several meshes as a single Rhino mesh object.
+
+    Adding a separate Rhino object per mesh has a fixed cost per object.
+    When many meshes share the same name, color, and layer,
+    combining them into a single object reduces the number of document updates
+    from one per mesh to one in total.
+
+    Parameters
+    ----------
+    items : list[tuple[list[[float, float, float] or :class:`compas.geometry.Point`], list[list[int]]]]
+        A list of vertex/face pairs, with each pair defined as for :func:`draw_mesh`.
+    name : str, optional
+    color : tuple[[int, int, int]], optional
+    disjoint : bool, optional
+        If True, draw the meshes with disjoint faces.
+
+    Returns
+    -------
+    System.Guid
+
+    """
+    vertices = []
+    faces = []
+    for mesh_vertices, mesh_faces in items:
+        offset = len(vertices)
+        vertices.extend(mesh_vertices)
+        faces.extend([offset + index for index in face] for face in mesh_faces)
+    return draw_mesh(vertices, faces, name=name, color=color, disjoint=disjoint, **kwargs)
+
+
 @wrap_drawfunc
 def draw_faces(faces, **kwargs):
     """Draw faces as individual meshes and optionally set individual name, color, and layer properties.